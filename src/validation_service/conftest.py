@@ -0,0 +1 @@
+# Lets the tests import `core` the same way main.py does.
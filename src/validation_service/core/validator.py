@@ -1,98 +1,145 @@
+import csv
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pandas as pd
-from typing import List, Dict
-import csv
+from typing import List, Dict, Optional
 from datetime import datetime
+from itertools import chain, islice
+
+
+FIELDNAMES = ['error_level', 'error_text', 'file_name', 'folder_name', 'line_number']
 
 
 class RawValidator:
     def __init__(self, config: Dict):
         self.config = config["raw"]
-        self.errors: List[Dict] = []
+        # columnar: one list per report field, all of the same length
+        self.errors: Dict[str, List] = _new_errors()
 
     def validate(self, base_path: str) -> str:
         base_path = Path(base_path)
-        self._check_folders(base_path)
-        self._check_files(base_path)
-        
+        listings = self._scan_folders(base_path)
+        self._check_folders(base_path, listings)
+        self._check_files(listings)
+
         # for filenaming
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         output_file = f"validation_report_{timestamp}.csv"
+        self._generate_report(output_file)
 
-        with open(output_file, 'w', newline='') as csvfile:
-            fieldnames = ['error_level', 'error_text', 'file_name', 'folder_name', 'line_number']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            
-            for error in self.errors:
-                writer.writerow(error)
-        
         return output_file
 
-    def _check_folders(self, base_path: Path):
+    def _generate_report(self, output_file: str):
+        # \r\n keeps the line endings csv.DictWriter produced
+        pd.DataFrame(self.errors, columns=FIELDNAMES).to_csv(
+            output_file, index=False, lineterminator='\r\n'
+        )
+
+    def _scan_folders(self, base_path: Path) -> Dict[str, Optional[List[os.DirEntry]]]:
+        # scan every configured folder once; only folders with file requirements
+        # need a full listing, the rest are probed for their first entry
+        listings = {}
+        for folder in self.config["file_requirements"]:
+            listings[folder] = _list_folder(base_path / folder)
+        for folder in self.config["required_folders"]:
+            if folder not in listings:
+                listings[folder] = _list_folder(base_path / folder, limit=1)
+        return listings
+
+    def _check_folders(self, base_path: Path, listings: Dict[str, Optional[List[os.DirEntry]]]):
         for folder in self.config["required_folders"]:
             folder_path = base_path / folder
-            if not folder_path.exists():
-                self.errors.append({
-                    'error_level': 'error',
-                    'error_text': f"Required folder '{folder}' is missing",
-                    'file_name': '',
-                    'folder_name': str(folder_path),
-                    'line_number': ''
-                })
-            elif not any(folder_path.iterdir()):
-                self.errors.append({
-                    'error_level': 'warning',
-                    'error_text': f"Folder '{folder}' does not contain any file",
-                    'file_name': '',
-                    'folder_name': str(folder_path),
-                    'line_number': ''
-                })
-
-    def _check_files(self, base_path: Path):
+            entries = listings[folder]
+            if entries is None:
+                _add_error(
+                    self.errors,
+                    error_level='error',
+                    error_text=f"Required folder '{folder}' is missing",
+                    folder_name=str(folder_path)
+                )
+            elif not entries:
+                _add_error(
+                    self.errors,
+                    error_level='warning',
+                    error_text=f"Folder '{folder}' does not contain any file",
+                    folder_name=str(folder_path)
+                )
+
+    def _check_files(self, listings: Dict[str, Optional[List[os.DirEntry]]]):
+        tasks = []
         for folder, requirements in self.config["file_requirements"].items():
-            folder_path = base_path / folder
+            for entry in listings[folder] or []:
+                if _is_file(entry):
+                    tasks.append((Path(entry.path), requirements["required_columns"]))
+
+        # header reads are I/O bound, so threads are enough to overlap them
+        with ThreadPoolExecutor() as executor:
+            for errors in executor.map(lambda task: _validate_columns(*task), tasks):
+                for name in FIELDNAMES:
+                    self.errors[name].extend(errors[name])
+
+
+def _list_folder(folder_path: Path, limit: Optional[int] = None) -> Optional[List[os.DirEntry]]:
+    # None marks a missing folder
+    try:
+        with os.scandir(folder_path) as entries:
+            return list(islice(entries, limit))
+    except FileNotFoundError:
+        return None
+
+
+def _is_file(entry: os.DirEntry) -> bool:
+    # Path.is_file() treated ELOOP/ENOTDIR/EBADF as "not a file"; DirEntry raises instead
+    try:
+        return entry.is_file()
+    except OSError:
+        return False
+
+
+def _new_errors() -> Dict[str, List]:
+    return {name: [] for name in FIELDNAMES}
+
+
+def _add_error(errors: Dict[str, List], error_level: str, error_text: str,
+               file_name: str = '', folder_name: str = '', line_number=''):
+    errors['error_level'].append(error_level)
+    errors['error_text'].append(error_text)
+    errors['file_name'].append(file_name)
+    errors['folder_name'].append(folder_name)
+    errors['line_number'].append(line_number)
+
+
+def _read_header(file_path: Path) -> List[str]:
+    # like pd.read_csv: strip a BOM and skip leading lines made only of spaces and tabs.
+    # This is checked on the raw text, since csv.reader turns both '   ' and '" "' into [' ']
+    # and pandas keeps the quoted one as a header.
+    with open(file_path, newline='', encoding='utf-8-sig') as f:
+        for line in f:
+            if line.strip(' \t\r\n'):
+                return next(csv.reader(chain([line], f)))
+    raise ValueError("No columns to parse from file")
+
+
+def _validate_columns(file_path: Path, required_columns: List[str]) -> Dict[str, List]:
+    errors = _new_errors()
+    file_name, folder_name = file_path.name, str(file_path.parent)
+
+    def add_error(error_text: str, error_level: str = 'error'):
+        _add_error(errors, error_level, error_text, file_name, folder_name)
+
+    try:
+        if file_path.suffix == ".csv":
+            header = _read_header(file_path)
+        else:
+            add_error(f"Unsupported file format: {file_path}")
+            return errors
+
+        columns = set(header)
+        missing = [col for col in required_columns if col not in columns]
+        for col in missing:
+            add_error(f"Required column '{col}' is missing")
 
-            if not folder_path.exists():
-                continue
-
-            for file_path in folder_path.iterdir():
-                if file_path.is_file():
-                    self._validate_columns(
-                        file_path=file_path,
-                        required_columns=requirements["required_columns"]
-                    )
-
-    def _validate_columns(self, file_path: Path, required_columns: List[str]):
-        try:
-            if file_path.suffix == ".csv":
-                df = pd.read_csv(file_path, nrows=0)
-            else:
-                self.errors.append({
-                    'error_level': 'error',
-                    'error_text': f"Unsupported file format: {file_path}",
-                    'file_name': file_path.name,
-                    'folder_name': str(file_path.parent),
-                    'line_number': ''
-                })
-                return
-
-            missing = [col for col in required_columns if col not in df.columns]
-            if missing:
-                for col in missing:
-                    self.errors.append({
-                        'error_level': 'error',
-                        'error_text': f"Required column '{col}' is missing",
-                        'file_name': file_path.name,
-                        'folder_name': str(file_path.parent),
-                        'line_number': ''
-                    })
-
-        except Exception as e:
-            self.errors.append({
-                'error_level': 'error',
-                'error_text': f"Failed to read {file_path}: {str(e)}",
-                'file_name': file_path.name,
-                'folder_name': str(file_path.parent),
-                'line_number': ''
-            })
\ No newline at end of file
+    except Exception as e:
+        add_error(f"Failed to read {file_path}: {str(e)}")
+    return errors
@@ -2,9 +2,12 @@ import yaml
 
 from core.validator import RawValidator
 
+# LibYAML bindings when PyYAML was built with them, pure-Python otherwise
+SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 def load_config(path: str) -> dict:
     with open(path) as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=SafeLoader)
 
 if __name__ == "__main__":
     config = load_config("config/validation_rules/raw.yaml")
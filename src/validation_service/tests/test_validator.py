@@ -0,0 +1,43 @@
+import pytest
+
+from core.validator import _read_header, _validate_columns
+
+
+@pytest.mark.parametrize("content, expected", [
+    # lines made only of spaces and tabs are skipped, as pandas' skip_blank_lines does
+    ("   \na,b\n", ["a", "b"]),
+    ("\t\na,b\n", ["a", "b"]),
+    ("\r\n  \t\r\na,b\n", ["a", "b"]),
+    ("\ufeffa,b\n1,2\n", ["a", "b"]),
+    # rows of empty or quoted cells are a header, pandas keeps them too
+    (",,,\na,b,c\n", ["", "", "", ""]),
+    (" , \na,b\n", [" ", " "]),
+    ('" "\na,b\n', [" "]),
+    ("\xa0\na,b\n", ["\xa0"]),
+])
+def test_read_header(tmp_path, content, expected):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text(content, encoding="utf-8")
+
+    assert _read_header(file_path) == expected
+
+
+@pytest.mark.parametrize("content", ["", "\n\n", "  \n"])
+def test_read_header_no_columns(tmp_path, content):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text(content, encoding="utf-8")
+
+    with pytest.raises(ValueError, match="No columns to parse from file"):
+        _read_header(file_path)
+
+
+def test_validate_columns_empty_header_row(tmp_path):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text(",,,\na,b,c\n", encoding="utf-8")
+
+    errors = _validate_columns(file_path, ["a", "b"])
+
+    assert errors["error_text"] == [
+        "Required column 'a' is missing",
+        "Required column 'b' is missing",
+    ]